@@ -9,7 +9,7 @@ def advanced_bar_chart_plotter(data, col_names, bar_settings, point_settings, sy
     and add data points with customizable appearance and fonts.
 
     Parameters:
-    - data: A DataFrame with customizable columns for group, category, and value.
+    - data: A DataFrame with customizable columns for group, category, and value (e.g. the output of transform_data, including compact=True).
     - col_names: Dictionary containing column names for 'group', 'category', and 'value'.
     - bar_settings: Dictionary containing settings for bars ('width', 'distance', 'group_distance', 'colors', 'edge_colors', 'error_bar_orientation', 'error_bar_color', 'error_bar_capsize', 'error_bar_capthick', 'error_bar_elinewidth').
     - point_settings: Dictionary containing settings for points ('shapes', 'fills', 'edge_colors', 'sizes').
@@ -51,9 +51,8 @@ def advanced_bar_chart_plotter(data, col_names, bar_settings, point_settings, sy
     symbol_sizes = symbol_settings.get('sizes', [14, 12, 12])
     symbol_colors = symbol_settings.get('colors', ['black', 'black', 'black'])
 
-    # Map categories to numeric values
-    category_mapping = {category: idx for idx, category in enumerate(data[category_col].unique())}
-    data['CategoryIndex'] = data[category_col].map(category_mapping)
+    # Map categories to numeric values (works for plain and categorical labels)
+    data['CategoryIndex'] = pd.Index(data[category_col].unique()).get_indexer(data[category_col])
 
     # Create a position for each bar
     unique_groups = data[group_col].unique()
@@ -71,13 +70,13 @@ def advanced_bar_chart_plotter(data, col_names, bar_settings, point_settings, sy
         fig, ax = plt.subplots(figsize=(7, 4))
 
     # Plot bars
-    for i, (group, group_data) in enumerate(data.groupby(group_col)):
+    for i, (group, group_data) in enumerate(data.groupby(group_col, observed=True)):
         for j, (category, cat_data) in enumerate(group_data.groupby('CategoryIndex')):
             bar_position = group_positions[group] + j * (bar_width + bar_distance)
 
             # Calculate mean and SEM
-            mean_value = np.mean(cat_data[value_col].values[0])
-            sem = np.std(cat_data[value_col].values[0]) / np.sqrt(len(cat_data[value_col].values[0]))
+            mean_value = np.mean(cat_data[value_col].values[0], dtype=np.float64)
+            sem = np.std(cat_data[value_col].values[0], dtype=np.float64) / np.sqrt(len(cat_data[value_col].values[0]))
             max_value = np.max(cat_data[value_col].values[0])
 
             # Plot bar
@@ -166,7 +165,7 @@ def advanced_bar_chart_plotter(data, col_names, bar_settings, point_settings, sy
     # Show category names below each bar and group names below them if show_labels is True
     if show_labels:
 
-        for group, group_data in data.groupby(group_col):
+        for group, group_data in data.groupby(group_col, observed=True):
             positions = group_data['Position'].unique()
             category_names = group_data[category_col].unique()
             for j, (pos, cat_name) in enumerate(zip(positions, category_names)):
@@ -10,7 +10,7 @@ def advanced_line_plotter(data, col_names, line_settings, point_settings, symbol
     Create a line plot with custom distances between points, and add data points with customizable appearance and symbols.
 
     Parameters:
-    - data: A DataFrame with customizable columns for group, category, and value.
+    - data: A DataFrame with customizable columns for group, category, and value (e.g. the output of transform_data, including compact=True).
     - col_names: Dictionary containing column names for 'group', 'category', and 'value'.
     - line_settings: Dictionary containing settings for lines ('colors', 'linestyles', 'linewidths', 'error_bar_color', 'error_bar_capsize', 'error_bar_capthick', 'error_bar_elinewidth', 'error_bar_orientation').
     - point_settings: Dictionary containing settings for points ('shapes', 'fills', 'edge_colors', 'sizes').
@@ -52,10 +52,9 @@ def advanced_line_plotter(data, col_names, line_settings, point_settings, symbol
     symbol_sizes = [14, 14, 14]
     symbol_colors = ['black', 'black', 'black']
 
-    # Map categories to numeric values with custom spacing
+    # Map categories to numeric values with custom spacing (works for plain and categorical labels)
     unique_categories = data[category_col].unique()
-    category_mapping = {category: idx * category_spacing for idx, category in enumerate(unique_categories)}
-    data['CategoryIndex'] = data[category_col].map(category_mapping)
+    data['CategoryIndex'] = pd.Index(unique_categories).get_indexer(data[category_col]) * category_spacing
 
     # Create figure and axis
     if fig_size:
@@ -63,27 +62,31 @@ def advanced_line_plotter(data, col_names, line_settings, point_settings, symbol
     else:
         fig, ax = plt.subplots(figsize=(7, 4))
 
+    # Function to calculate the mean, accumulated in float64
+    def mean(x):
+        return np.mean(x, dtype=np.float64)
+
     # Function to calculate SEM
     def sem(x):
-        return np.std(x) / np.sqrt(len(x))
+        return np.std(x, dtype=np.float64) / np.sqrt(len(x))
 
 
 
 
     if show_points:
-      max_vals_per_category = data.groupby(category_col)[value_col].apply(lambda x: max([item for sublist in x for item in sublist])).values
-      min_vals_per_category = data.groupby(category_col)[value_col].apply(lambda x: min([item for sublist in x for item in sublist])).values
+      max_vals_per_category = data.groupby(category_col, observed=True)[value_col].apply(lambda x: max([item for sublist in x for item in sublist])).values
+      min_vals_per_category = data.groupby(category_col, observed=True)[value_col].apply(lambda x: min([item for sublist in x for item in sublist])).values
     else:
-      max_vals_per_category = data.groupby(category_col)[value_col].apply(lambda x: max([np.mean(sublist)+sem(sublist) for sublist in x])).values
-      min_vals_per_category = data.groupby(category_col)[value_col].apply(lambda x: min([np.mean(sublist)-sem(sublist) for sublist in x])).values
+      max_vals_per_category = data.groupby(category_col, observed=True)[value_col].apply(lambda x: max([mean(sublist)+sem(sublist) for sublist in x])).values
+      min_vals_per_category = data.groupby(category_col, observed=True)[value_col].apply(lambda x: min([mean(sublist)-sem(sublist) for sublist in x])).values
 
     overall_max_val = np.max(max_vals_per_category)
     overall_min_val = np.min(min_vals_per_category)
 
     # Plot lines and points for each group
-    for i, (group, group_data) in enumerate(data.groupby(group_col)):
+    for i, (group, group_data) in enumerate(data.groupby(group_col, observed=True)):
         positions = group_data['CategoryIndex'].values
-        means = group_data[value_col].apply(np.mean).values
+        means = group_data[value_col].apply(mean).values
         sems = group_data[value_col].apply(sem).values
         ax.plot(positions, means, color=line_colors[i], linestyle=linestyles[i], linewidth=linewidths[i], label=group)
 
@@ -1,19 +1,31 @@
+import numpy as np
 import pandas as pd
 from statsmodels.stats.multicomp import pairwise_tukeyhsd
 from scipy.stats import f_oneway, ttest_rel
 
-def statistical_analysis(df, method, columns):
+def statistical_analysis(df, method, columns, compact=False):
     # Dynamically identify columns from the dictionary
 
     group_col = columns.get('group', 'Group')
     comparison_col = columns.get('category', 'Category')
     values_col = columns.get('value', 'Value')
 
+    # Compact mode: categorical keys, so the repeated group/category comparisons run on integer codes
+    if compact:
+        df = df.astype({group_col: 'category', comparison_col: 'category'})
+
+    # Function to extract values for the statistics, always accumulated in float64
+    def float64_values(df_subset):
+        return df_subset[values_col].to_numpy(dtype=np.float64)
+
+    # Function to compute the mean of a subset in float64
+    def float64_mean(df_subset):
+        return df_subset[values_col].astype(np.float64).mean()
 
     # Function to perform Tukey's HSD test
     def perform_tukey_hsd(df, comparison_col, group_col, values_col, group_name):
         df_subset = df[df[group_col] == group_name]
-        tukey = pairwise_tukeyhsd(endog=df_subset[values_col], groups=df_subset[comparison_col], alpha=0.05)
+        tukey = pairwise_tukeyhsd(endog=float64_values(df_subset), groups=df_subset[comparison_col], alpha=0.05)
         return tukey
 
     # Function to map p-values to significance annotations
@@ -32,7 +44,7 @@ def statistical_analysis(df, method, columns):
     # Function to perform one-way ANOVA
     def perform_oneway_anova(df, comparison_col, group_col, values_col, group_name):
         df_subset = df[df[group_col] == group_name]
-        compares = [df_subset[df_subset[comparison_col] == compare][values_col].values for compare in df_subset[comparison_col].unique()]
+        compares = [float64_values(df_subset[df_subset[comparison_col] == compare]) for compare in df_subset[comparison_col].unique()]
         f_stat, p_value = f_oneway(*compares)
         return f_stat, p_value
 
@@ -40,8 +52,8 @@ def statistical_analysis(df, method, columns):
     def perform_paired_ttest(df, comparison_col, group_col, values_col, group_name):
         df_subset = df[df[group_col] == group_name]
         unique_compares = df_subset[comparison_col].unique()
-        compare1_values = df_subset[df_subset[comparison_col] == unique_compares[0]][values_col].values
-        compare2_values = df_subset[df_subset[comparison_col] == unique_compares[1]][values_col].values
+        compare1_values = float64_values(df_subset[df_subset[comparison_col] == unique_compares[0]])
+        compare2_values = float64_values(df_subset[df_subset[comparison_col] == unique_compares[1]])
         t_stat, p_value = ttest_rel(compare1_values, compare2_values)
         return t_stat, p_value
 
@@ -61,15 +73,15 @@ def statistical_analysis(df, method, columns):
             for row in summary:
                 compare1, compare2, meandiff, p_adj, lower, upper, reject = row
                 results[group][f"{compare1} vs {compare2}"] = (meandiff, p_adj)
-                mean_values[group][compare1] = df[(df[group_col] == group) & (df[comparison_col] == compare1)][values_col].mean()
-                mean_values[group][compare2] = df[(df[group_col] == group) & (df[comparison_col] == compare2)][values_col].mean()
+                mean_values[group][compare1] = float64_mean(df[(df[group_col] == group) & (df[comparison_col] == compare1)])
+                mean_values[group][compare2] = float64_mean(df[(df[group_col] == group) & (df[comparison_col] == compare2)])
         elif method == '1way':
             df_subset = df[df[group_col] == group]
             if len(unique_compares) == 2:
                 t_stat, p_value = perform_paired_ttest(df, comparison_col, group_col, values_col, group)
                 results[group][f"{unique_compares[0]} vs {unique_compares[1]}"] = (t_stat, p_value)
-                mean_values[group][unique_compares[0]] = df_subset[df_subset[comparison_col] == unique_compares[0]][values_col].mean()
-                mean_values[group][unique_compares[1]] = df_subset[df_subset[comparison_col] == unique_compares[1]][values_col].mean()
+                mean_values[group][unique_compares[0]] = float64_mean(df_subset[df_subset[comparison_col] == unique_compares[0]])
+                mean_values[group][unique_compares[1]] = float64_mean(df_subset[df_subset[comparison_col] == unique_compares[1]])
             else:
                 f_stat, p_value = perform_oneway_anova(df, comparison_col, group_col, values_col, group)
                 tukey_results = perform_tukey_hsd(df, comparison_col, group_col, values_col, group)
@@ -77,8 +89,8 @@ def statistical_analysis(df, method, columns):
                 for row in summary:
                     compare1, compare2, meandiff, p_adj, lower, upper, reject = row
                     results[group][f"{compare1} vs {compare2}"] = (meandiff, p_adj)
-                    mean_values[group][compare1] = df[(df[group_col] == group) & (df[comparison_col] == compare1)][values_col].mean()
-                    mean_values[group][compare2] = df[(df[group_col] == group) & (df[comparison_col] == compare2)][values_col].mean()
+                    mean_values[group][compare1] = float64_mean(df[(df[group_col] == group) & (df[comparison_col] == compare1)])
+                    mean_values[group][compare2] = float64_mean(df[(df[group_col] == group) & (df[comparison_col] == compare2)])
 
     # Convert results to a list of lists based on mean differences
     final_results = {}
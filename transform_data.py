@@ -1,6 +1,7 @@
+import numpy as np
 import pandas as pd
 
-def transform_data(data, group_col, category_col, value_col):
+def transform_data(data, group_col, category_col, value_col, compact=False):
     """
     Transforms the given data into the desired format.
 
@@ -9,6 +10,10 @@ def transform_data(data, group_col, category_col, value_col):
     group_col (str): The name of the column to be used as the group.
     category_col (str): The name of the column to be used as the category.
     value_col (str): The name of the column to be used as the value.
+    compact (bool): If True, store group and category labels as pandas Categoricals (categories are sorted by
+                    pandas, so grouping follows the same order as plain labels and missing labels are dropped)
+                    and the values of each cell as a float32 numpy array instead of a list. The result can be
+                    passed directly to the plotters.
 
     Returns:
     pd.DataFrame: Transformed DataFrame with columns 'Group', 'Category', and 'DataPoint'.
@@ -16,8 +21,16 @@ def transform_data(data, group_col, category_col, value_col):
     # Convert the data to a pandas DataFrame
     df = pd.DataFrame(data)
 
-    # Group the data by the specified group and category columns, and aggregate the values into lists
-    grouped = df.groupby([group_col, category_col], sort=False)[value_col].apply(list).reset_index()
+    if compact:
+        # Categorical keys make the grouping compare integer codes instead of strings
+        df = df.astype({group_col: 'category', category_col: 'category', value_col: np.float32})
+
+        # Aggregate the values of each group/category pair into float32 arrays
+        grouped = df.groupby([group_col, category_col], sort=False, observed=True)[value_col].apply(
+            lambda x: x.to_numpy(dtype=np.float32)).reset_index()
+    else:
+        # Group the data by the specified group and category columns, and aggregate the values into lists
+        grouped = df.groupby([group_col, category_col], sort=False)[value_col].apply(list).reset_index()
 
     # Rename columns to match the desired format
     grouped.rename(columns={group_col: 'Group', category_col: 'Category', value_col: 'DataPoint'}, inplace=True)